@@ -1,9 +1,18 @@
 import pandas as pd
+import numpy as np
+import pyarrow as pa
+from pyarrow import csv as pacsv
+from pyarrow import parquet as pq
 import os
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
+import queue
+import atexit
 import sys
 import sqlite3 
+import itertools
+from collections import Counter
+from typing import Iterable, Iterator
 
 # --- LOGGER CONFIGURATION ---
 LOG_FILE = "logs/etl_pipeline.log"
@@ -13,70 +22,225 @@ os.makedirs(os.path.dirname(LOG_FILE), exist_ok=True)
 # 1. Create the logger object
 logger = logging.getLogger('KickstarterETL')
 logger.setLevel(logging.INFO) # Minimum logging level (INFO, WARNING, ERROR, DEBUG)
+# Do not pass records on to the root logger, it would write them a second time if configured
+logger.propagate = False
 
 # 2. Configure the log message format
+# The format does not use thread/process info, so skip collecting it for every record
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
 formatter = logging.Formatter(
     '%(asctime)s - %(name)s - %(levelname)s - %(message)s', 
     datefmt='%Y-%m-%d %H:%M:%S'
 )
 
-# 3. Handler to write to the file (Rotation to avoid giant files)
-# The file will rotate at 5MB and keep 2 backup files.
-file_handler = RotatingFileHandler(
-    LOG_FILE, 
-    maxBytes=5*1024*1024, 
-    backupCount=2,
-    encoding='utf-8'
-)
-file_handler.setFormatter(formatter)
-
-# 4. Handler to show logs on the console (sys.stdout)
-stream_handler = logging.StreamHandler(sys.stdout)
-stream_handler.setFormatter(formatter)
-
-# 5. Add the handlers to the logger
-logger.addHandler(file_handler)
-logger.addHandler(stream_handler)
+class LocalQueueHandler(QueueHandler):
+    """
+    QueueHandler for an in-process queue. The base class formats the record (message and
+    traceback) on the calling thread so it can be pickled; nothing is pickled here, so the
+    record is enqueued as-is and all formatting happens on the listener thread.
+    """
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+# Configure the handlers only once: getLogger returns the same object on every import,
+# so re-importing this module would otherwise stack duplicate handlers (and listeners).
+if not logger.handlers:
+    # 3. Handler to write to the file (Rotation to avoid giant files)
+    # The file will rotate at 5MB and keep 2 backup files.
+    file_handler = RotatingFileHandler(
+        LOG_FILE, 
+        maxBytes=5*1024*1024, 
+        backupCount=2,
+        encoding='utf-8'
+    )
+    file_handler.setFormatter(formatter)
+
+    # 4. Handler to show logs on the console (sys.stdout)
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(formatter)
+
+    # 5. Route records through a queue: the ETL thread only enqueues them and a background
+    # listener thread does the formatting and the file/console writes.
+    log_queue = queue.Queue(-1)
+    logger.addHandler(LocalQueueHandler(log_queue))
+    log_listener = QueueListener(log_queue, file_handler, stream_handler, respect_handler_level=True)
+    log_listener.start()
+    # Flush the remaining records when the interpreter exits
+    atexit.register(log_listener.stop)
 # ---------------------------------
 
 # Define the path to the data file
 FILE_PATH = "data/raw/ks-projects-201801.csv"
 
-def extract_data(file_path: str) -> pd.DataFrame:
+# Explicit types for the columns the pipeline uses, so the CSV reader skips type inference
+# for them. Dates arrive already parsed as timestamps.
+CSV_COLUMN_TYPES = {
+    'ID': pa.int64(),
+    'name': pa.string(),
+    'main_category': pa.string(),
+    'category': pa.string(),
+    'country': pa.string(),
+    'backers': pa.int32(),
+    'usd_pledged_real': pa.float64(),
+    'usd_goal_real': pa.float64(),
+    'state': pa.string(),
+    'launched': pa.timestamp('s'),
+    'deadline': pa.timestamp('s'),
+}
+
+# Number of rows extracted, transformed and loaded at a time
+CHUNK_SIZE = 200_000
+
+# Low-cardinality text columns stored as pandas 'category' (integer codes + small lookup)
+CATEGORICAL_COLUMNS = ('state', 'main_category', 'category', 'country')
+
+def batches_to_dataframe(batches: list) -> pd.DataFrame:
+    """
+    Converts a list of Arrow record batches into one pandas DataFrame chunk.
     """
-    Extracts (reads) the Kickstarter dataset from the CSV file.
+    table = pa.Table.from_batches(batches)
+    df = table.to_pandas(split_blocks=True, self_destruct=True)
+    del table
+    for col in CATEGORICAL_COLUMNS:
+        df[col] = df[col].astype('category')
+    return df
+
+# Parquet metadata key holding the CSV_COLUMN_TYPES the cache was written with
+CACHE_SCHEMA_KEY = b'kickstarter_etl.csv_column_types'
+
+def csv_schema_fingerprint() -> bytes:
+    """
+    Returns a stable text representation of CSV_COLUMN_TYPES, stored in the Parquet cache.
+    """
+    return repr(sorted((col, str(col_type)) for col, col_type in CSV_COLUMN_TYPES.items())).encode('utf-8')
+
+def open_parquet_cache(parquet_path: str, file_path: str):
+    """
+    Opens the Parquet cache of `file_path` if it can be reused: it must be newer than the CSV
+    and have been written with the current CSV_COLUMN_TYPES. Returns None otherwise.
+    """
+    if not os.path.exists(parquet_path) or os.path.getmtime(parquet_path) < os.path.getmtime(file_path):
+        return None
+    try:
+        parquet_cache = pq.ParquetFile(parquet_path)
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable Parquet cache {parquet_path}: {e}")
+        return None
+    metadata = parquet_cache.schema_arrow.metadata or {}
+    if metadata.get(CACHE_SCHEMA_KEY) != csv_schema_fingerprint():
+        logger.warning(f"Ignoring Parquet cache {parquet_path}: it was written with different column types.")
+        return None
+    return parquet_cache
+
+def extract_data(file_path: str, chunk_size: int = CHUNK_SIZE) -> Iterator[pd.DataFrame]:
+    """
+    Extracts (reads) the Kickstarter dataset from the CSV file as a stream of DataFrame
+    chunks of about `chunk_size` rows, so memory use is bounded by the chunk, not the file.
+    The parsed data is cached as a Parquet file next to the CSV and reused on later runs
+    as long as it is newer than the CSV and matches CSV_COLUMN_TYPES.
+    Nothing is yielded if the file cannot be opened. Errors while reading the stream are
+    logged and re-raised to the consumer: the Load phase rolls back if it is already running.
     """
     logger.info("Extraction started.")
     logger.info(f"Attempting to read the file: {file_path}")
+    parquet_path = os.path.splitext(file_path)[0] + ".parquet"
+    cache_tmp_path = parquet_path + ".tmp"
+    cache_writer = None
     try:
-        # Here we use the encoding that works best for your data
-        df = pd.read_csv(file_path, encoding='utf-8') 
-        logger.info("Extraction completed successfully.")
-        logger.info(f"DataFrame loaded with {df.shape[0]} rows and {df.shape[1]} columns.")
-        return df
+        parquet_cache = open_parquet_cache(parquet_path, file_path)
+        if parquet_cache is not None:
+            logger.info(f"Using cached Parquet file: {parquet_path}")
+            batches = parquet_cache.iter_batches(batch_size=chunk_size)
+        else:
+            # PyArrow's multithreaded C++ parser is much faster than pd.read_csv on this file
+            batches = pacsv.open_csv(
+                file_path,
+                read_options=pacsv.ReadOptions(use_threads=True, block_size=1 << 22, encoding='utf8'),
+                convert_options=pacsv.ConvertOptions(column_types=CSV_COLUMN_TYPES, strings_can_be_null=True)
+            )
+            try:
+                # Written to a temporary file that only replaces the cache once the whole CSV is read
+                cache_schema = batches.schema.with_metadata({CACHE_SCHEMA_KEY: csv_schema_fingerprint()})
+                cache_writer = pq.ParquetWriter(
+                    cache_tmp_path, cache_schema, compression='zstd', use_dictionary=True, write_statistics=True
+                )
+            except Exception as e:
+                # The cache is only an optimization, a failed write must not stop the pipeline
+                logger.warning(f"Could not write the Parquet cache {parquet_path}: {e}")
     except FileNotFoundError:
         # A critical error is logged if the main file is not found
         logger.critical(f"CRITICAL Error: The file was not found at {file_path}. Terminating execution.")
-        return None
+        return
     except Exception as e:
-        # An error is logged if any other issue occurs during reading
+        # An error is logged if any other issue occurs while opening the file
         logger.error(f"An unexpected error occurred during extraction: {e}", exc_info=True)
-        return None
+        return
+
+    total_rows = 0
+    chunk_count = 0
+    completed = False
+    pending, pending_rows = [], 0
+
+    def take_chunk() -> pd.DataFrame:
+        # Converts the pending batches into the next chunk and resets the buffer
+        nonlocal total_rows, chunk_count, pending_rows
+        df = batches_to_dataframe(pending)
+        pending.clear()
+        pending_rows = 0
+        chunk_count += 1
+        total_rows += len(df)
+        logger.info(f"Chunk {chunk_count} extracted with {df.shape[0]} rows and {df.shape[1]} columns.")
+        return df
+
+    try:
+        for batch in batches:
+            if cache_writer is not None:
+                try:
+                    cache_writer.write_batch(batch)
+                except Exception as e:
+                    logger.warning(f"Could not write the Parquet cache {parquet_path}: {e}")
+                    cache_writer.close()
+                    cache_writer = None
+                    try:
+                        os.remove(cache_tmp_path)
+                    except OSError:
+                        pass
+            pending.append(batch)
+            pending_rows += batch.num_rows
+            if pending_rows >= chunk_size:
+                yield take_chunk()
+        if pending:
+            yield take_chunk()
+        completed = True
+        logger.info(f"Extraction completed successfully. {total_rows} rows read in {chunk_count} chunks.")
+    except Exception as e:
+        # An error is logged if any other issue occurs during reading; the consumer logs the traceback
+        logger.error(f"An unexpected error occurred during extraction: {e}")
+        raise
+    finally:
+        if cache_writer is not None:
+            cache_writer.close()
+            if completed:
+                os.replace(cache_tmp_path, parquet_path)
+                logger.info(f"Parsed data cached to {parquet_path}")
+            else:
+                os.remove(cache_tmp_path)
 
 def inspect_data(df: pd.DataFrame):
     """
-    Performs an initial inspection of the DataFrame and logs the information.
+    Performs an initial inspection of the DataFrame (the first extracted chunk) and logs the information.
+    The value counts over the whole dataset are logged by transform_chunks once every chunk is read.
     """
     if df is not None:
         logger.info("--- Starting Initial Data Inspection ---")
         
-        # Log the first rows and data types at DEBUG/INFO level
-        logger.debug("First 5 rows:\n" + str(df.head()))
-        logger.info("\nData types of columns:\n" + str(df.dtypes))
-        
-        # Counting states is useful for data quality
-        state_counts = df['state'].value_counts()
-        logger.info(f"Count of unique values in 'state':\n{state_counts.to_string()}")
+        # Log the first rows and data types at DEBUG/INFO level.
+        # The pandas reprs are only built when the level is actually enabled.
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("First 5 rows:\n%s", df.head())
+        logger.info("\nData types of columns:\n%s", df.dtypes)
         
         logger.info("Initial data inspection completed.")
 
@@ -85,14 +249,29 @@ def transform_data(df: pd.DataFrame) -> pd.DataFrame:
     Make the necessary transformations to clean and model the data.
     """
     logger.info("Starting Data Transformation phase.")
+
+    # Work on a copy of just the raw columns the model needs: the rest are never read, the
+    # caller's DataFrame is left untouched, and the result does not need a full copy at the end
+    source_columns = [
+        'ID', 'name', 'main_category', 'category', 'country', 'backers',
+        'usd_pledged_real', 'usd_goal_real', 'state', 'launched', 'deadline'
+    ]
+    df = df[source_columns].copy()
     
     # --- 1. Cleaning and Creating Dates/Times ---
-    # Convert date columns to datetime format
-    df['launched_at'] = pd.to_datetime(df['launched'])
-    df['deadline_at'] = pd.to_datetime(df['deadline'])
+    # Convert date columns to datetime format. The Arrow reader already delivers timestamps;
+    # text input is parsed with an explicit format (C fast path) and de-duplicated via cache.
+    for source_col, target_col, date_format in (
+        ('launched', 'launched_at', '%Y-%m-%d %H:%M:%S'),
+        ('deadline', 'deadline_at', '%Y-%m-%d'),
+    ):
+        if pd.api.types.is_datetime64_any_dtype(df[source_col]):
+            df[target_col] = df[source_col]
+        else:
+            df[target_col] = pd.to_datetime(df[source_col], format=date_format, cache=True)
     
     # Calculate campaign duration in days
-    df['duration_days'] = (df['deadline_at'] - df['launched_at']).dt.total_seconds() / (60 * 60 * 24)
+    df['duration_days'] = (df['deadline_at'] - df['launched_at']) / pd.Timedelta(days=1)
     logger.info("Dates converted to datetime and campaign duration calculated.")
     
     # --- 2. Currency Unification and Key Metrics ---
@@ -105,15 +284,16 @@ def transform_data(df: pd.DataFrame) -> pd.DataFrame:
     
     # --- 3. Success Flag Creation ---
     # Map the state to 1 (success) or 0 (failure, canceled, suspended, etc.)
-    SUCCESS_STATES = ['successful']
-    df['success_flag'] = df['state'].apply(lambda x: 1 if x in SUCCESS_STATES else 0)
+    SUCCESS_STATES = frozenset(['successful'])
+    df['success_flag'] = df['state'].isin(SUCCESS_STATES).to_numpy(dtype=np.int8)
     logger.info("Binary flag 'success_flag' created.")
 
-    initial_rows = len(df)
-    df = df.dropna(subset=['name'])
-
-    rows_removed = initial_rows - len(df)
+    # Boolean mask of rows with a name (vectorized null check). The selection, and the
+    # copy it implies, is skipped when no row has to be removed.
+    keep = df['name'].notna().to_numpy()
+    rows_removed = int((~keep).sum())
     if rows_removed > 0:
+        df = df.loc[keep]
         logger.warning(f"Removed {rows_removed} rows because the 'name' field was null (NOT NULL constraint).")
     else:
         logger.info("No null values found in critical NOT NULL columns.")
@@ -135,11 +315,47 @@ def transform_data(df: pd.DataFrame) -> pd.DataFrame:
         'deadline_at', 
         'duration_days'
     ]
-    df_transformed = df[final_columns].copy()
+    df_transformed = df[final_columns]
     
     logger.info(f"Transformation completed. New DataFrame has {df_transformed.shape[0]} rows and {df_transformed.shape[1]} columns.")
     return df_transformed
 
+def transform_chunks(chunks: Iterable[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+    """
+    Inspect and transform the extracted chunks one at a time, as they are consumed.
+    Only the first chunk is inspected in detail; the value counts are added up across all
+    chunks and logged once, after the last one.
+    """
+    collect_counts = logger.isEnabledFor(logging.INFO)
+    state_counts = Counter()
+    success_flag_counts = Counter()
+    null_pledged = 0
+
+    for chunk_number, df in enumerate(chunks, start=1):
+        if chunk_number == 1:
+            inspect_data(df)
+        if collect_counts:
+            state_counts.update(df['state'].value_counts(sort=False).to_dict())
+
+        # Call the transformation function
+        transformed_df = transform_data(df)
+
+        if collect_counts:
+            success_flag_counts.update(transformed_df['success_flag'].value_counts(sort=False).to_dict())
+            null_pledged += int(transformed_df['pledged_usd'].isnull().sum())
+
+        yield transformed_df
+
+    # Counting states is useful for data quality
+    if collect_counts:
+        observed_states = pd.Series({state: count for state, count in state_counts.items() if count > 0})
+        logger.info("Count of unique values in 'state':\n%s", observed_states.sort_values(ascending=False).to_string())
+
+        # Quick inspection of the transformed data
+        logger.info("Inspecting transformed data:")
+        logger.info("Unique values in 'success_flag':\n%s", pd.Series(success_flag_counts).sort_index().to_string())
+        logger.info("Null values in 'pledged_usd': %s", null_pledged)
+
 # --- LOAD PHASE FUNCTIONS ---
 DB_FILE = "data/kickstarter_warehouse.db" # Nombre del archivo de base de datos SQLite
 
@@ -160,21 +376,32 @@ def create_db_schema(conn: sqlite3.Connection):
     except Exception as e:
         logger.error(f"Error executing the SQL script: {e}", exc_info=True)
 
-def load_dim_date(df: pd.DataFrame, conn: sqlite3.Connection) -> dict:
+def date_key_from_datetime(dates: pd.Series) -> np.ndarray:
+    """
+    Calcula la date_key entera YYYYMMDD con aritmética sobre los componentes de la fecha
+    (sin strftime por fila).
+    """
+    return (dates.dt.year.to_numpy() * 10000
+            + dates.dt.month.to_numpy() * 100
+            + dates.dt.day.to_numpy()).astype(np.int32)
+
+def load_dim_date(df: pd.DataFrame, conn: sqlite3.Connection):
     """
     Genera y carga la Dimensión de Fecha (Dim_Date) a partir de las fechas de lanzamiento únicas.
-    Devuelve un diccionario de mapeo: 'YYYY-MM-DD' -> date_key (YYYYMMDD).
+    La date_key (YYYYMMDD) se obtiene con date_key_from_datetime, así que la tabla de hechos
+    puede calcularla directamente sin un diccionario de mapeo.
+    No hace commit: se ejecuta dentro de la transacción única de load_data.
     """
     logger.info("Initiating load of Dim_Date...")
     cursor = conn.cursor()
     
     # 1. Obtener todas las fechas únicas de lanzamiento
-    unique_dates = df['launched_at'].dt.date.astype(str).unique()
+    unique_dates = df['launched_at'].dt.normalize().drop_duplicates().to_numpy()
     
     # 2. Create a temporary dimension DataFrame from unique dates
     date_df = pd.DataFrame({'full_date': unique_dates})
-    date_df['full_date'] = pd.to_datetime(date_df['full_date'])
 
+    # Only the (few thousand) unique dates are formatted, for the full_date text column
     date_df['full_date_str'] = date_df['full_date'].dt.strftime('%Y-%m-%d')
 
     # 3. Generate dimension attributes
@@ -183,15 +410,15 @@ def load_dim_date(df: pd.DataFrame, conn: sqlite3.Connection) -> dict:
     date_df['day'] = date_df['full_date'].dt.day
     date_df['quarter'] = date_df['full_date'].dt.quarter
     date_df['day_of_week'] = date_df['full_date'].dt.day_name()
-    date_df['is_weekend'] = date_df['full_date'].apply(lambda x: 1 if x.weekday() >= 5 else 0) # 5=Sábado, 6=Domingo
+    date_df['is_weekend'] = (date_df['full_date'].dt.dayofweek >= 5).astype(np.int8) # 5=Sábado, 6=Domingo
     
     # 4. Generar la clave de fecha (date_key) como un entero YYYYMMDD
-    date_df['date_key'] = date_df['full_date'].dt.strftime('%Y%m%d').astype(int)
+    date_df['date_key'] = date_key_from_datetime(date_df['full_date'])
     
-    # 5. Preparar los datos para la inserción
+    # 5. Preparar los datos para la inserción (tuplas simples por fila, sin construir una Series por fila)
     insert_data = date_df[[
         'date_key', 'full_date_str', 'year', 'quarter', 'month', 'day', 'day_of_week', 'is_weekend'
-    ]].values.tolist()
+    ]].itertuples(index=False, name=None)
     
     # 6. Insertar en la tabla Dim_Date
     insert_sql = """
@@ -199,84 +426,179 @@ def load_dim_date(df: pd.DataFrame, conn: sqlite3.Connection) -> dict:
     VALUES (?, ?, ?, ?, ?, ?, ?, ?)
     """
     cursor.executemany(insert_sql, insert_data)
-    conn.commit()
     logger.info(f"Dim_Date cargada con {len(date_df)} fechas únicas.")
-    
-    # 7. Crear el mapeo: 'YYYY-MM-DD' -> date_key
-    date_df['full_date_str'] = date_df['full_date'].dt.strftime('%Y-%m-%d')
-    date_map = date_df.set_index('full_date_str')['date_key'].to_dict()
-    
-    return date_map
 
-def load_data(df: pd.DataFrame, conn: sqlite3.Connection):
+def insert_multirow(conn: sqlite3.Connection, insert_prefix: str, rows, n_rows: int, n_columns: int,
+                    rows_per_statement: int = 1000):
     """
-    Decompose the DataFrame into fact and dimension tables and load them into the DB.
+    Insert rows using multi-row "VALUES (...), (...), ..." statements.
+    SQLite compiles one statement per batch of rows instead of one per row.
+    `insert_prefix` is the statement up to and including "VALUES ".
     """
-    logger.info("Starting the Load (L) phase into the Data Warehouse.")
+    # Stay under SQLite's limit of bound parameters per statement
+    try:
+        max_variables = conn.getlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER)
+    except AttributeError:
+        max_variables = 999  # Python < 3.11: assume the historical SQLite default
+    rows_per_statement = max(1, min(rows_per_statement, max_variables // n_columns))
+
+    row_placeholder = "(" + ", ".join(["?"] * n_columns) + ")"
+    rows = iter(rows)
+
+    # Full batches share the same statement, so it is prepared only once
+    n_full_batches = n_rows // rows_per_statement
+    full_batches = (
+        tuple(itertools.chain.from_iterable(itertools.islice(rows, rows_per_statement)))
+        for _ in range(n_full_batches)
+    )
+    conn.executemany(insert_prefix + ", ".join([row_placeholder] * rows_per_statement), full_batches)
+
+    # Remaining rows (fewer than one batch) go in a single last statement
+    remainder = list(rows)
+    if remainder:
+        conn.execute(
+            insert_prefix + ", ".join([row_placeholder] * len(remainder)),
+            tuple(itertools.chain.from_iterable(remainder))
+        )
+
+def integer_keys_or_null(keys: np.ndarray) -> np.ndarray:
+    """
+    Returns looked-up foreign keys as integers, or unchanged as floats when some lookups
+    failed: the NaN entries are then stored as NULL, like an unmatched pandas .map().
+    """
+    if np.isnan(keys).any():
+        return keys
+    return keys.astype(np.int64)
+
+# Columns of the transformed data that load_chunk reads
+LOAD_COLUMNS = [
+    'ID', 'name', 'main_category', 'category', 'backers', 'pledged_usd', 'goal_usd',
+    'duration_days', 'state', 'success_flag', 'launched_at'
+]
+
+def load_chunk(df: pd.DataFrame, conn: sqlite3.Connection) -> int:
+    """
+    Decompose one transformed chunk into fact and dimension rows and insert them.
+    Dimension rows already loaded by earlier chunks are ignored. Returns the number of fact rows.
+    """
+    # Only the columns needed for the dimensions and the fact table are carried along
+    df = df[LOAD_COLUMNS]
     cursor = conn.cursor()
 
-    # --- 0. OBTAIN DATE MAPPING ---
-    date_map = load_dim_date(df, conn)
+    # --- 0. Load Dim_Date ---
+    load_dim_date(df, conn)
 
     # --- 1. Load Dim_State ---
     logger.info("Loading Dimension Dim_State...")
-    dim_state_data = df[['state', 'success_flag']].drop_duplicates().sort_values('state')
-    
-    state_map = {}
-    for index, row in dim_state_data.iterrows():
-        # Try to insert, ignoring if it already exists (to ensure uniqueness)
-        cursor.execute(
-            "INSERT OR IGNORE INTO Dim_State (state_name, is_successful) VALUES (?, ?)", 
-            (row['state'], row['success_flag'])
-        )
-        # Get the generated (or existing) key for mapping
-        cursor.execute("SELECT state_key FROM Dim_State WHERE state_name = ?", (row['state'],))
-        state_map[row['state']] = cursor.fetchone()[0]
-    
-    conn.commit()
+    # Grouping on the categorical codes gives the chunk's distinct states already in sorted
+    # order without a separate sort step. dropna=False keeps null states so they are
+    # reported below instead of being silently left out of the dimension.
+    dim_state_data = df.groupby('state', observed=True, dropna=False)['success_flag'].first().reset_index()
+    # INSERT OR IGNORE would also skip rows violating NOT NULL, so check explicitly
+    if dim_state_data['state'].isna().any():
+        raise ValueError("Null values found in 'state' (Dim_State.state_name is NOT NULL).")
+
+    # Insert every state in one batch, then read the generated keys back once
+    cursor.executemany(
+        "INSERT OR IGNORE INTO Dim_State (state_name, is_successful) VALUES (?, ?)",
+        zip(dim_state_data['state'].tolist(), dim_state_data['success_flag'].tolist())
+    )
+    state_map = dict(cursor.execute("SELECT state_name, state_key FROM Dim_State").fetchall())
     logger.info(f"Dim_State loaded. Found {len(state_map)} unique states.")
-    
+
     # --- 2. Load Dim_Category ---
     logger.info("Loading Dimension Dim_Category...")
-    dim_category_data = df[['main_category', 'category']].drop_duplicates().sort_values(['main_category', 'category'])
-
-    category_map = {}
-    for index, row in dim_category_data.iterrows():
-        cursor.execute(
-            "INSERT OR IGNORE INTO Dim_Category (main_category_name, sub_category_name) VALUES (?, ?)",
-            (row['main_category'], row['category'])
+    dim_category_data = df.groupby(['main_category', 'category'], observed=True, dropna=False).size().reset_index()
+    if dim_category_data[['main_category', 'category']].isna().any(axis=None):
+        raise ValueError("Null values found in 'main_category'/'category' (Dim_Category columns are NOT NULL).")
+
+    cursor.executemany(
+        "INSERT OR IGNORE INTO Dim_Category (main_category_name, sub_category_name) VALUES (?, ?)",
+        zip(dim_category_data['main_category'].tolist(), dim_category_data['category'].tolist())
+    )
+    category_map = {
+        (main_category, sub_category): category_key
+        for category_key, main_category, sub_category in cursor.execute(
+            "SELECT category_key, main_category_name, sub_category_name FROM Dim_Category"
         )
-        cursor.execute("SELECT category_key FROM Dim_Category WHERE main_category_name = ? AND sub_category_name = ?", 
-                       (row['main_category'], row['category']))
-        category_map[(row['main_category'], row['category'])] = cursor.fetchone()[0]
-
-    conn.commit()
+    }
     logger.info(f"Dim_Category loaded. Found {len(category_map)} unique categories.")
 
     # --- 3. Prepare and Load Fact_Campaigns ---
     logger.info("Preparing and loading Fact_Campaigns...")
-    
-    # Map the fact data with foreign keys
-    df['state_key'] = df['state'].map(state_map)
-    df['category_key'] = df.apply(lambda row: category_map.get((row['main_category'], row['category'])), axis=1)
-    df['launched_date_key'] = df['launched_at'].dt.strftime('%Y-%m-%d').map(date_map)
 
-    # Select the final columns for the fact table
+    # Map the fact data with foreign keys. Each category is looked up once and the
+    # resulting key array is indexed with the integer codes (no per-row Python calls).
+    # Values without a key, including missing values (code -1, mapped to the extra trailing
+    # slot), get NaN so they are stored as NULL.
+    state_keys = np.array(
+        [state_map.get(state, np.nan) for state in df['state'].cat.categories] + [np.nan], dtype=np.float64
+    )
+    fact_state_keys = integer_keys_or_null(state_keys[df['state'].cat.codes.to_numpy()])
+
+    main_categories = df['main_category'].cat.categories
+    sub_categories = df['category'].cat.categories
+    category_keys = np.full((len(main_categories) + 1, len(sub_categories) + 1), np.nan, dtype=np.float64)
+    for (main_category, sub_category), category_key in category_map.items():
+        if main_category in main_categories and sub_category in sub_categories:
+            category_keys[main_categories.get_loc(main_category), sub_categories.get_loc(sub_category)] = category_key
+    fact_category_keys = integer_keys_or_null(category_keys[
+        df['main_category'].cat.codes.to_numpy(), df['category'].cat.codes.to_numpy()
+    ])
+
+    fact_date_keys = date_key_from_datetime(df['launched_at'])
+
+    # Select the final columns for the fact table (the keys are added with assign() rather
+    # than written into the df column selection)
     fact_columns = [
         'ID', 'name', 'backers', 'pledged_usd', 'goal_usd', 'duration_days', 
         'state_key', 'category_key', 'launched_date_key'
     ]
-    fact_data = df[fact_columns]
+    fact_data = df.assign(
+        state_key=fact_state_keys, category_key=fact_category_keys, launched_date_key=fact_date_keys
+    )[fact_columns]
 
     # Insertar en la Tabla de Hechos (Fact_Campaigns)
-    insert_sql = """
+    insert_prefix = """
     INSERT INTO Fact_Campaigns (campaign_id, name, backers, pledged_usd, goal_usd, 
                                 duration_days, state_key, category_key, launched_date_key) 
-    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    VALUES """
+    # Stream plain row tuples (no list of lists) into multi-row INSERT statements
+    insert_multirow(
+        conn, insert_prefix, fact_data.itertuples(index=False, name=None),
+        n_rows=len(fact_data), n_columns=len(fact_columns)
+    )
+
+    cursor.close()
+    return len(fact_data)
+
+def load_data(chunks: Iterable[pd.DataFrame], conn: sqlite3.Connection):
+    """
+    Decompose the transformed DataFrame chunks into fact and dimension tables and load them into the DB.
     """
-    cursor.executemany(insert_sql, fact_data.values.tolist())
-    conn.commit()
-    logger.info(f"Fact_Campaigns cargada con {len(fact_data)} registros.")
+    logger.info("Starting the Load (L) phase into the Data Warehouse.")
+    # Bulk-load friendly journaling: WAL + NORMAL sync only fsyncs at checkpoints
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA cache_size=-262144")  # 256 MB page cache
+    conn.execute("PRAGMA temp_store=MEMORY")
+    cursor = conn.cursor()
+
+    # The whole Load phase (every chunk) is a single transaction: one commit (and fsync) at
+    # the end of the 'with' block, or a rollback if any step fails.
+    with conn:
+        conn.execute("BEGIN")
+
+        fact_rows = 0
+        for df in chunks:
+            fact_rows += load_chunk(df, conn)
+        logger.info(f"Fact_Campaigns cargada con {fact_rows} registros.")
+
+        # Foreign key indexes are built after the bulk insert, so SQLite does not have to
+        # maintain them row by row during the load
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_fact_state_key ON Fact_Campaigns (state_key)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_fact_category_key ON Fact_Campaigns (category_key)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_fact_launched_date_key ON Fact_Campaigns (launched_date_key)")
 
     cursor.close()
     conn.close()
@@ -286,24 +608,24 @@ if __name__ == "__main__":
     logger.info("==============================================")
     logger.info("START OF KICKSTARTER ETL PIPELINE")
     
-    kickstarter_df = extract_data(FILE_PATH)
+    kickstarter_chunks = extract_data(FILE_PATH)
+    try:
+        first_chunk = next(kickstarter_chunks, None)
+    except Exception as e:
+        # No data was loaded yet, so there is nothing to roll back
+        logger.critical(f"CRITICAL FAILURE - EXTRACTING DATA: {e}", exc_info=True)
+        first_chunk = None
     
-    if kickstarter_df is not None:
-        inspect_data(kickstarter_df)
-
-        # Call the transformation function
-        transformed_df = transform_data(kickstarter_df)
-
-        # Quick inspection of the transformed data
-        logger.info("Inspecting transformed data:")
-        logger.info(f"Unique values in 'success_flag':\n{transformed_df['success_flag'].value_counts().to_string()}")
-        logger.info(f"Null values in 'pledged_usd': {transformed_df['pledged_usd'].isnull().sum()}")
+    if first_chunk is not None:
+        kickstarter_chunks = itertools.chain([first_chunk], kickstarter_chunks)
+        del first_chunk
 
         # ---------------- LOAD PHASE ----------------
+        # Chunks are extracted and transformed lazily, one at a time, as the Load phase consumes them
         try:
             conn = sqlite3.connect(DB_FILE)
             create_db_schema(conn)
-            load_data(transformed_df, conn)
+            load_data(transform_chunks(kickstarter_chunks), conn)
         except Exception as e:
             logger.critical(f"CRITICAL FAILURE - LOADING DATA: {e}", exc_info=True)
         finally: